@@ -23,6 +23,8 @@ import traceback
 from datetime import datetime
 from colorama import Fore, Style, init
 
+from tools import sync_categories
+
 #################################################################################
 #                               INITIALIZATION                                   #
 #################################################################################
@@ -36,6 +38,10 @@ This section handles the initial setup of the application, including:
 # Initialize colorama
 init(autoreset=True)
 
+# Run child scripts with the interpreter running this CLI, so they see the
+# same installed packages and no PATH lookup is needed
+PYTHON_CMD = sys.executable
+
 # Global variables for configuration
 CONFIG = {
     "urls_per_category": 2500,
@@ -96,11 +102,11 @@ This section contains functions that handle the user interface elements:
 def clear_screen():
     """Clear the terminal screen
     
-    Uses the appropriate command based on the operating system:
-    - 'cls' for Windows
-    - 'clear' for Unix-based systems (macOS, Linux)
+    Writes the ANSI "erase display" and "cursor home" sequences directly
+    instead of shelling out to 'cls'/'clear', which spawned a shell on every
+    menu redraw. On Windows, colorama translates these sequences for the console.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    print("\033[2J\033[H", end="", flush=True)
 
 def print_header():
     """Print the application header
@@ -194,15 +200,15 @@ This section manages category-related operations:
 def load_categories():
     """Load available categories from the configuration file
     
-    Reads the categories JSON file and loads its contents.
+    Reads the categories JSON file through sync_categories.load_categories,
+    which reuses the parsed file until it changes on disk.
     
     Returns:
         list: List of category names, or empty list if loading failed
     """
     try:
-        with open(CONFIG["categories_file"], 'r', encoding='utf-8') as f:
-            categories_data = json.load(f)
-            return list(categories_data.keys())
+        categories_data = sync_categories.load_categories(CONFIG["categories_file"])
+        return list(categories_data.keys())
     except Exception as e:
         print(f"{Fore.RED}Error loading categories: {str(e)}{Style.RESET_ALL}")
         return []
@@ -257,16 +263,26 @@ This section implements the core operations of the application:
 def sync_folders():
     """Sync categories to directory structure
     
-    Runs the sync_categories.py script to ensure the output directory structure
-    matches the categories defined in the configuration file.
+    Calls sync_categories.main() in-process to ensure the output directory
+    structure matches the categories defined in the configuration file.
+    The sync only touches a handful of files, so it is not worth the cost of
+    starting a second Python interpreter.
     
     Returns:
         bool: True if synchronization was successful, False otherwise
     """
-    return run_command(
-        ["python3", "tools/sync_categories.py"],
-        "Category sync"
-    )
+    print(f"{Fore.GREEN}Starting: Category sync{Style.RESET_ALL}")
+    try:
+        success = sync_categories.main()
+    except Exception as e:
+        print(f"{Fore.RED}Error during category sync: {str(e)}{Style.RESET_ALL}")
+        success = False
+    
+    if success:
+        print(f"{Fore.GREEN}✅ Category sync completed successfully.{Style.RESET_ALL}")
+    else:
+        print(f"{Fore.RED}❌ Category sync failed.{Style.RESET_ALL}")
+    return success
 
 def run_tests():
     """Run crawler tests
@@ -280,7 +296,7 @@ def run_tests():
     
     # Directly run full test suite with all crawlers
     command = [
-        "python3", "src/tests/test_crawler.py",
+        PYTHON_CMD, "src/tests/test_crawler.py",
         "--full",
         "--report",
         "--output-dir", "output/test_urls"
@@ -300,7 +316,7 @@ def run_extraction_tests():
     print(f"{Fore.YELLOW}Running extraction test suite...{Style.RESET_ALL}")
     
     # Run the full test suite with report generation enabled
-    command = ["python3", "src/tests/test_extractor.py", "--report"]
+    command = [PYTHON_CMD, "src/tests/test_extractor.py", "--report"]
     
     print(f"{Fore.CYAN}Executing: {' '.join(command)}{Style.RESET_ALL}")
     return run_command(command, "Extraction test suite")
@@ -318,7 +334,7 @@ def crawl_urls(categories=None, resume=False):
         bool: True if crawling completed successfully, False otherwise
     """
     command = [
-        "python3", "src/crawlers/master_crawler_controller.py",
+        PYTHON_CMD, "src/crawlers/master_crawler_controller.py",
         "--max-urls", str(CONFIG["urls_per_category"]),
         "--output-dir", CONFIG["urls_dir"]
     ]
@@ -388,7 +404,7 @@ def run_full_workflow(categories=None, resume=False):
     if CONFIG["stop_requested"]:
         return False
     
-    return extract_content(categories, resume)
+    return extract_content(resume)
 
 #################################################################################
 #                          CONFIGURATION MANAGEMENT                              #
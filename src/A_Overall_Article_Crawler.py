@@ -22,7 +22,6 @@ import itertools
 # Import for stack trace logging
 import traceback
 # Import for URL safe filenames
-import re
 import hashlib
 # Import for command line argument parsing
 import argparse
@@ -579,11 +578,14 @@ def ensure_log_directories():
     # Also ensure checkpoint directory exists
     os.makedirs(CHECKPOINT_DIR, exist_ok=True)
 
+# Unsafe filename characters, deleted with str.translate rather than a regex pass
+UNSAFE_FILENAME_CHARS = str.maketrans("", "", '\\/*?:"<>|')
+
 # No need for URL-to-filename conversion since we're using categories directly
 def get_safe_category_name(category):
     """Convert a category to a safe filename"""
     # Remove unsafe filename characters
-    return re.sub(r'[\\/*?:"<>|]', "", category)
+    return category.translate(UNSAFE_FILENAME_CHARS)
 
 # Log category-specific errors to JSON
 def log_category_error(category, url, error_message, html_file=None):
@@ -970,8 +972,13 @@ def save_article_data(category, article_data, url=None):
                 if os.path.exists(output_file):
                     backup_file = f"{output_file}.bak.{int(time.time())}"
                     try:
-                        import shutil
-                        shutil.copy2(output_file, backup_file)
+                        # The file is later swapped out with os.replace, so a hard link
+                        # keeps the old contents without copying them
+                        try:
+                            os.link(output_file, backup_file)
+                        except OSError:
+                            import shutil
+                            shutil.copy2(output_file, backup_file)
                         log_scrape_status(f"Created backup of corrupted file at {backup_file}")
                     except Exception as backup_err:
                         log_scrape_status(f"Failed to backup corrupted file: {backup_err}")
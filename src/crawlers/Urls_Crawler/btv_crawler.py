@@ -27,6 +27,9 @@ from src.utils.cmd_utils import parse_crawler_args, get_categories_from_args
 # Initialize logger
 logger = get_crawler_logger('btv')
 
+# Article ID (ASCII digits only) in a URL path, compiled once for the per-URL loops below
+ARTICLE_ID_PATTERN = re.compile(r'/article/(\d+)', re.ASCII)
+
 def extract_btv_urls(html: str, base_url: str) -> Set[str]:
     """Extract article URLs from page HTML."""
     urls = set()
@@ -69,7 +72,7 @@ def extract_btv_urls(html: str, base_url: str) -> Set[str]:
     # Extract only the article IDs and create clean URLs
     btv_domain = 'btv.com.kh'
     for url in potential_urls:
-        if match := re.search(r'/article/(\d+)', url):
+        if match := ARTICLE_ID_PATTERN.search(url):
             article_id = match.group(1)
             clean_url = f"https://{btv_domain}/article/{article_id}/"
             urls.add(clean_url)
@@ -110,7 +113,7 @@ def filter_btv_urls(urls: Set[str], category: str) -> list:
             continue
             
         # Check for article pattern
-        if match := re.search(r'/article/(\d+)', url):
+        if match := ARTICLE_ID_PATTERN.search(url):
             article_id = match.group(1)
             # Ensure URL has consistent format with trailing slash
             clean_url = f"https://{btv_domain}/article/{article_id}/"
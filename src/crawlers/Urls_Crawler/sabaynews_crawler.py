@@ -30,6 +30,9 @@ from src.utils.cmd_utils import parse_crawler_args, get_categories_from_args
 # Initialize logger with color coding
 logger = get_crawler_logger('sabaynews')
 
+# Article ID (ASCII digits only) in a URL path, compiled once for the per-URL loops below
+ARTICLE_ID_PATTERN = re.compile(r'/article/(\d+)', re.ASCII)
+
 # ==== URL SCRAPING FUNCTIONS ====
 def extract_sabay_urls(html: str, base_url: str) -> Set[str]:
     """
@@ -140,7 +143,7 @@ def filter_sabay_urls(urls: Set[str], category: str) -> list:
         # Accept any URL with news.sabay.com.kh and article in it
         if "news.sabay.com.kh" in clean_url and "/article/" in clean_url:
             # Extract the article ID and create a standard URL format
-            if match := re.search(r'/article/(\d+)', clean_url):
+            if match := ARTICLE_ID_PATTERN.search(clean_url):
                 article_id = match.group(1)
                 standardized_url = f"https://news.sabay.com.kh/article/{article_id}"
                 result.add(standardized_url)
@@ -42,8 +42,14 @@ def save_urls(file_path, new_urls):
         except json.JSONDecodeError:
             logger.error(f"Error reading {file_path}, treating as empty")
     
+    # Nothing new and no duplicates to drop: the file already holds this exact set
+    existing_set = set(existing_urls)
+    if existing_urls and len(existing_set) == len(existing_urls) and existing_set.issuperset(new_urls):
+        logger.info(f"No new URLs for {file_path}, total: {len(existing_urls)}")
+        return len(existing_urls)
+    
     # Merge URLs and remove duplicates
-    all_urls = list(set(existing_urls + new_urls))
+    all_urls = list(existing_set.union(new_urls))
     
     # Write to temp file first
     temp_file = f"{file_path}.tmp"
@@ -62,8 +62,10 @@ class IncrementalURLSaver:
         """Load existing URLs from JSON files."""
         try:
             # First, identify all JSON files in the output directory
-            files = [f for f in os.listdir(self.output_dir) 
-                    if f.endswith('.json') and os.path.isfile(os.path.join(self.output_dir, f))]
+            # (scandir's DirEntry.is_file reuses the directory listing instead of a stat per file)
+            with os.scandir(self.output_dir) as entries:
+                files = [entry.name for entry in entries
+                         if entry.name.endswith('.json') and entry.is_file()]
             
             self.logger.debug(f"Found {len(files)} JSON files in {self.output_dir}")
             
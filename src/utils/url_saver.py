@@ -1,75 +1,197 @@
 import os
+import re
 import json
+import mmap
+import shutil
 import logging
-import time
 import threading
-from typing import Set, Dict, List, Iterable, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Set, Dict, List, Iterable, Union, Optional, BinaryIO
+
+# Pending temp-file bytes per category before add_urls flushes them to disk
+TEMP_FLUSH_BYTES = 64 * 1024
+
+# A JSON string literal, including any escaped quotes inside it
+_JSON_STRING_PATTERN = re.compile(rb'"((?:[^"\\]|\\.)*)"')
+
+def _dump_urls_json(urls: List[str], ensure_ascii: bool = False, indent: int = 4) -> bytes:
+    """Serialize a URL list to JSON bytes."""
+    return json.dumps(urls, ensure_ascii=ensure_ascii, indent=indent).encode("utf-8")
 
 class URLSaver:
     def __init__(self, output_dir: str, crawler_name: str):
         self.output_dir = output_dir
         self.crawler_name = crawler_name
+        # Guards the per-category lock tables; each category's URLs and temp
+        # file have their own locks so workers on different categories never
+        # wait on each other
         self.lock = threading.Lock()
+        self._category_locks: Dict[str, threading.Lock] = {}
+        self._temp_locks: Dict[str, threading.Lock] = {}
         self.logger = logging.getLogger(f"{crawler_name}_url_saver")
         
-        self.temp_dir = os.path.join(output_dir, "temp", f"{int(time.time())}_{crawler_name}")
-        os.makedirs(self.temp_dir, exist_ok=True)
-        os.makedirs(output_dir, exist_ok=True)
+        # Per-saver temp dir, so two savers never append to the same file;
+        # it is only created once something is actually written to it
+        self.temp_dir = os.path.join(output_dir, "temp", f"{os.getpid()}_{id(self):x}_{crawler_name}")
+        self._known_dirs: Set[str] = set()
+        self._ensure_dir(output_dir)
         
-        self.category_urls: Dict[str, Set[str]] = {}
+        # URLs are kept UTF-8 encoded; bytes carry less per-entry overhead than str
+        self.category_urls: Dict[str, Set[bytes]] = {}
+        self._temp_handles: Dict[str, BinaryIO] = {}
+        self._pending: Dict[str, List[bytes]] = {}
+        self._pending_bytes: Dict[str, int] = {}
     
     def add_urls(self, category: str, urls: Iterable[str]) -> None:
+        encoded_urls = {url.encode("utf-8") for url in urls}
+        with self._category_lock(category):
+            known_urls = self.category_urls[category]
+            new_urls = encoded_urls - known_urls
+            if not new_urls:
+                return
+            known_urls.update(new_urls)
+            self._pending.setdefault(category, []).extend(new_urls)
+            pending_bytes = self._pending_bytes.get(category, 0) + sum(len(url) + 1 for url in new_urls)
+            self._pending_bytes[category] = pending_bytes
+            if pending_bytes < TEMP_FLUSH_BYTES:
+                return
+            batch = self._take_pending(category)
+        # Write outside the category lock so other adds are not held up by disk I/O
+        self._save_temp_file(category, batch)
+    
+    def _category_lock(self, category: str) -> threading.Lock:
+        lock = self._category_locks.get(category)
+        if lock is None:
+            with self.lock:
+                lock = self._category_locks.get(category)
+                if lock is None:
+                    self.category_urls.setdefault(category, set())
+                    self._temp_locks[category] = threading.Lock()
+                    lock = self._category_locks[category] = threading.Lock()
+        return lock
+    
+    def _ensure_dir(self, dir_path: str) -> None:
+        if dir_path not in self._known_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self._known_dirs.add(dir_path)
+    
+    def _take_pending(self, category: str) -> List[bytes]:
+        self._pending_bytes[category] = 0
+        return self._pending.pop(category, [])
+    
+    def flush(self) -> None:
         with self.lock:
-            if category not in self.category_urls:
-                self.category_urls[category] = set()
-            self.category_urls[category].update(urls)
-            self._save_temp_file(category, urls)
+            categories = list(self._category_locks)
+        for category in categories:
+            with self._category_locks[category]:
+                batch = self._take_pending(category)
+            if batch:
+                self._save_temp_file(category, batch)
     
-    def _save_temp_file(self, category: str, urls: Iterable[str]) -> None:
-        temp_file = os.path.join(self.temp_dir, f"{category}_urls.json")
-        self._save_urls_to_file(urls, temp_file)
+    def _save_temp_file(self, category: str, urls: List[bytes]) -> None:
+        # Append only the new URLs, one per line, through a handle kept open per category
+        with self._temp_locks[category]:
+            f = self._temp_handles.get(category)
+            if f is None:
+                self._ensure_dir(self.temp_dir)
+                temp_file = os.path.join(self.temp_dir, f"{category}_urls.txt")
+                f = open(temp_file, "ab", buffering=1 << 16)
+                self._temp_handles[category] = f
+            f.writelines(url + b"\n" for url in urls)
         self.logger.info(f"Saved {len(urls)} URLs to temporary file for category '{category}'")
     
+    def close(self) -> None:
+        self.flush()
+        with self.lock:
+            categories = list(self._temp_handles)
+        for category in categories:
+            with self._temp_locks[category]:
+                self._temp_handles.pop(category).close()
+    
     def save_final_results(self) -> Dict[str, int]:
-        results = {}
-        for category, urls in self.category_urls.items():
-            output_file = os.path.join(self.output_dir, f"{category}.json")
-            existing_urls = set()
-            if os.path.exists(output_file):
-                existing_urls = set(self._load_urls_from_file(output_file))
-            final_urls = existing_urls.union(urls)
-            self._save_urls_to_file(final_urls, output_file)
-            results[category] = len(final_urls)
+        with self.lock:
+            categories = list(self.category_urls)
+        # The in-memory sets already hold every URL, so pending temp writes
+        # are dropped rather than flushed
+        for category in categories:
+            with self._category_locks[category]:
+                self._take_pending(category)
+        if not categories:
+            return {}
+        # Categories are merged into separate files, so their I/O can overlap
+        with ThreadPoolExecutor(max_workers=min(32, len(categories))) as executor:
+            futures = {category: executor.submit(self._merge_category, category)
+                       for category in categories}
+            results = {category: future.result() for category, future in futures.items()}
+        # Every URL is in the final files now, so the temp files are no longer needed
+        self.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self._known_dirs.discard(self.temp_dir)
         return results
     
+    def _merge_category(self, category: str) -> int:
+        output_file = os.path.join(self.output_dir, f"{category}.json")
+        final_urls = self._scan_existing_urls(output_file)
+        # Hold the category lock only for the in-memory merge, not the file I/O
+        with self._category_lock(category):
+            urls = self.category_urls[category]
+            if urls <= final_urls and os.path.exists(output_file):
+                # Nothing new for this category, so leave the file as it is
+                return len(final_urls)
+            # Merge into the larger set: copying a set is presized, growing one rehashes
+            if len(final_urls) >= len(urls):
+                final_urls |= urls
+            else:
+                merged_urls = set(urls)
+                merged_urls |= final_urls
+                final_urls = merged_urls
+        self._save_urls_to_file({url.decode("utf-8") for url in final_urls},
+                                output_file, durable=True)
+        return len(final_urls)
+    
+    def _scan_existing_urls(self, file_path: str) -> Set[bytes]:
+        # Pull the URL strings straight out of the mapped file instead of
+        # building the whole JSON document in memory first
+        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+            return set()
+        try:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return {self._decode_json_string(raw) for raw in _JSON_STRING_PATTERN.findall(mm)}
+        except Exception as e:
+            self.logger.error(f"Error scanning URLs in {file_path}: {e}")
+            return set()
+    
+    @staticmethod
+    def _decode_json_string(raw: bytes) -> bytes:
+        # Only escaped literals need a real JSON decode; the rest are already UTF-8
+        if b"\\" in raw:
+            return json.loads(b'"' + raw + b'"').encode("utf-8")
+        return raw
+    
     def _save_urls_to_file(self, urls: Iterable[str], file_path: str, 
                           format_type: str = "json", ensure_ascii: bool = False, 
-                          indent: int = 4) -> bool:
+                          indent: int = 4, durable: bool = False) -> bool:
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            urls_list = sorted(list(set(urls)))
+            self._ensure_dir(os.path.dirname(file_path))
+            # Sets are already unique, so only other iterables need deduplicating
+            urls_list = sorted(urls) if isinstance(urls, (set, frozenset)) else sorted(set(urls))
             if format_type.lower() == "json":
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(urls_list, f, ensure_ascii=ensure_ascii, indent=indent)
+                payload = _dump_urls_json(urls_list, ensure_ascii, indent)
             else:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    for url in urls_list:
-                        f.write(f"{url}\n")
+                payload = "".join(f"{url}\n" for url in urls_list).encode("utf-8")
+            # Write to a temp file and rename it over the target so readers
+            # never see a half-written file
+            temp_file = f"{file_path}.tmp"
+            with open(temp_file, "wb") as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_file, file_path)
             return True
         except Exception as e:
             self.logger.error(f"Error saving URLs to {file_path}: {e}")
             return False
-    
-    def _load_urls_from_file(self, file_path: str) -> List[str]:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.endswith('.json'):
-                    return json.load(f)
-                else:
-                    return [line.strip() for line in f if line.strip()]
-        except Exception as e:
-            self.logger.error(f"Error loading URLs from {file_path}: {e}")
-            return []
 
 # For testing the module directly
 if __name__ == "__main__":
@@ -82,6 +204,7 @@ if __name__ == "__main__":
     for category, urls in test_urls.items():
         url_saver.add_urls(category, urls)
     url_saver.save_final_results()
+    url_saver.close()
     url_saver.logger.info("Test completed")
 
 """
@@ -91,24 +214,25 @@ This module provides both class-based and functional interfaces for saving URLs.
 """
 
 # Standalone functions for direct use
-def save_urls_to_file(urls: Iterable[str], 
-                     output_path: str, 
-                     format_type: str = "json", 
-                     ensure_ascii: bool = False, 
-                     indent: int = 4,
-                     sort_urls: bool = True) -> bool:
-    """Save URLs to a file in either JSON or TXT format."""
+def _unique_urls(urls: Iterable[str], sort_urls: bool = True) -> List[str]:
+    """Deduplicate (and optionally sort) URLs once so they can be written repeatedly."""
+    unique_urls = list(set(urls))
+    if sort_urls:
+        unique_urls.sort()
+    return unique_urls
+
+def _write_unique_urls(unique_urls: List[str],
+                       output_path: str,
+                       format_type: str = "json",
+                       ensure_ascii: bool = False,
+                       indent: int = 4) -> bool:
+    """Write an already deduplicated URL list in either JSON or TXT format."""
     try:
         os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-        unique_urls = list(set(urls))
-        
-        if sort_urls:
-            unique_urls.sort()
-            
         if format_type.lower() == "json":
             temp_file = f"{output_path}.temp"
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(unique_urls, f, ensure_ascii=ensure_ascii, indent=indent)
+            with open(temp_file, "wb") as f:
+                f.write(_dump_urls_json(unique_urls, ensure_ascii, indent))
             os.replace(temp_file, output_path)
         else:
             with open(output_path, "w", encoding="utf-8") as f:
@@ -119,19 +243,38 @@ def save_urls_to_file(urls: Iterable[str],
         logging.error(f"Error saving URLs to {output_path}: {e}")
         return False
 
+def save_urls_to_file(urls: Iterable[str], 
+                     output_path: str, 
+                     format_type: str = "json", 
+                     ensure_ascii: bool = False, 
+                     indent: int = 4,
+                     sort_urls: bool = True) -> bool:
+    """Save URLs to a file in either JSON or TXT format."""
+    try:
+        unique_urls = _unique_urls(urls, sort_urls)
+    except Exception as e:
+        logging.error(f"Error saving URLs to {output_path}: {e}")
+        return False
+    return _write_unique_urls(unique_urls, output_path, format_type, ensure_ascii, indent)
+
 def save_urls_to_multiple_formats(urls: Iterable[str],
                                 base_path: str,
                                 formats: List[str] = ["json", "txt"],
                                 sort_urls: bool = True) -> Dict[str, bool]:
     """Save URLs to multiple file formats."""
     results = {}
-    for fmt in formats:
+    try:
+        # Deduplicate and sort once, then reuse the list for every format
+        unique_urls = _unique_urls(urls, sort_urls)
+    except Exception as e:
+        logging.error(f"Error preparing URLs for {base_path}: {e}")
+        return {fmt: False for fmt in formats}
+    for fmt in dict.fromkeys(formats):
         path = f"{base_path}.{fmt}"
-        results[fmt] = save_urls_to_file(
-            urls=urls,
+        results[fmt] = _write_unique_urls(
+            unique_urls=unique_urls,
             output_path=path,
-            format_type=fmt,
-            sort_urls=sort_urls
+            format_type=fmt
         )
     return results
 
@@ -4,8 +4,24 @@ Utility functions for handling URLs in crawlers.
 
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
+from functools import lru_cache
 import re
-from typing import Set, List, Dict
+from typing import Set, List, Dict, Pattern
+
+# Prefer the C-based lxml parser when it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+@lru_cache(maxsize=128)
+def _compile(pattern: str) -> Pattern:
+    """Compile a regex once and reuse it across calls."""
+    return re.compile(pattern)
+
+# Crawlers re-filter the same listing links page after page
+_parse_url = lru_cache(maxsize=8192)(urlparse)
 
 def extract_urls_with_pattern(html: str, base_url: str, pattern: str = None, tag: str = "a", 
                               class_name: str = None, contains_path: str = None) -> Set[str]:
@@ -24,22 +40,27 @@ def extract_urls_with_pattern(html: str, base_url: str, pattern: str = None, tag
         Set of URLs matching criteria
     """
     urls = set()
-    soup = BeautifulSoup(html, "html.parser")
+    # Only anchors carry the links we collect
+    if tag != "a":
+        return urls
+    
+    soup = BeautifulSoup(html, HTML_PARSER)
+    regex = _compile(pattern) if pattern else None
     
-    # Find elements based on tag and class if specified
+    # Find elements based on tag and class if specified, skipping those without an href
     if class_name:
-        elements = soup.find_all(tag, class_=class_name)
+        elements = soup.find_all(tag, class_=class_name, href=True)
     else:
-        elements = soup.find_all(tag)
+        elements = soup.find_all(tag, href=True)
     
     # Extract href attributes
     for element in elements:
-        href = element.get("href") if tag == "a" else None
+        href = element.get("href")
         if href:
             url = urljoin(base_url, href)
             
             # Apply filtering criteria
-            if pattern and not re.search(pattern, url):
+            if regex and not regex.search(url):
                 continue
                 
             if contains_path and contains_path not in url:
@@ -66,26 +87,36 @@ def filter_urls(urls: List[str], domain: str = None, contains: List[str] = None,
     """
     filtered = []
     
+    # Compile patterns once per call; excludes become one alternation scanned in a single pass
+    path_regex = _compile(path_pattern) if path_pattern else None
+    exclude_regex = _compile("|".join(map(re.escape, excludes))) if excludes else None
+    needs_parse = bool(domain or path_regex)
+    
     for url in urls:
         if not url or not isinstance(url, str):
             continue
             
-        parsed = urlparse(url)
-        
-        # Check domain
-        if domain and domain not in parsed.netloc:
+        # Cheap substring checks first so rejected URLs are never parsed
+        # Check excluded substrings
+        if exclude_regex and exclude_regex.search(url):
             continue
             
         # Check required substrings
         if contains and not all(item in url for item in contains):
             continue
             
-        # Check excluded substrings
-        if excludes and any(item in url for item in excludes):
+        if not needs_parse:
+            filtered.append(url)
+            continue
+            
+        parsed = _parse_url(url)
+        
+        # Check domain
+        if domain and domain not in parsed.netloc:
             continue
             
         # Check path pattern
-        if path_pattern and not re.search(path_pattern, parsed.path):
+        if path_regex and not path_regex.search(parsed.path):
             continue
             
         filtered.append(url)
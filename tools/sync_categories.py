@@ -8,6 +8,11 @@ import logging
 import shutil
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,6 +20,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Contents of a freshly created category file
+EMPTY_JSON_LIST = b"[]"
+
+def load_categories(categories_file="config/categories.json"):
+    """Load the categories mapping, parsed with orjson when it is installed."""
+    with open(categories_file, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 def setup_directory_structure():
     """Create all required directories."""
     base_dirs = [
@@ -28,18 +42,57 @@ def setup_directory_structure():
         "output/test_reports"
     ]
     
+    # List each parent once and only mkdir what is missing, so a warm tree
+    # costs a couple of directory reads instead of one mkdir per path
+    listings = {}
     for dir_path in base_dirs:
+        parent, name = os.path.split(dir_path)
+        if parent not in listings:
+            try:
+                listings[parent] = {entry.name for entry in os.scandir(parent)}
+            except FileNotFoundError:
+                listings[parent] = set()
+        if name in listings[parent]:
+            continue
         os.makedirs(dir_path, exist_ok=True)
-        logger.info(f"Ensured directory exists: {dir_path}")
+        logger.info(f"Created directory: {dir_path}")
+
+def _create_empty_json_file(json_path):
+    """Create an empty JSON list file unless one already exists."""
+    # Exclusive create: never truncate a file a running crawler has just written
+    try:
+        fd = os.open(json_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, EMPTY_JSON_LIST)
+    finally:
+        os.close(fd)
+    logger.debug(f"Created empty JSON file: {json_path}")
+    return True
 
 def create_empty_json_files(categories, base_path):
     """Create empty JSON files for each category."""
+    return create_category_files(categories, [base_path])
+
+def create_category_files(categories, directories):
+    """Create empty JSON files for each category in every directory in one pass."""
+    # One directory listing up front instead of a stat per category
+    existing = {directory: {entry.name for entry in os.scandir(directory)}
+                for directory in directories}
+    created = dict.fromkeys(directories, 0)
     for category in categories:
-        json_path = os.path.join(base_path, f"{category}.json")
-        if not os.path.exists(json_path):
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=2)
-            logger.info(f"Created empty JSON file: {json_path}")
+        filename = f"{category}.json"
+        for directory in directories:
+            if filename not in existing[directory]:
+                if _create_empty_json_file(os.path.join(directory, filename)):
+                    created[directory] += 1
+    
+    # One summary line per directory rather than one per file
+    for directory, count in created.items():
+        logger.info(f"Created {count} empty JSON files in {directory} "
+                    f"(existing: {len(categories) - count})")
+    return sum(created.values())
 
 def main():
     """Main function to sync categories to directory structure."""
@@ -62,21 +115,20 @@ def main():
     
     try:
         # Load categories from file
-        with open(categories_file, 'r', encoding='utf-8') as f:
-            categories = json.load(f)
+        categories = load_categories(categories_file)
         
         category_names = list(categories.keys())
         logger.info(f"Loaded {len(category_names)} categories from {categories_file}")
         
-        # Create directories and empty JSON files
-        for directory in [urls_dir, test_urls_dir]:
+        # Create directories, then the empty JSON files for all of them in one pass
+        category_dirs = [urls_dir, test_urls_dir]
+        for directory in category_dirs:
             os.makedirs(directory, exist_ok=True)
             logger.info(f"Ensured directory exists: {directory}")
-            create_empty_json_files(category_names, directory)
+        create_category_files(category_names, category_dirs)
         
         # Log the categories that will be processed
-        for category in category_names:
-            logger.info(f"Ready to process category: {category}")
+        logger.info(f"Ready to process categories: {', '.join(category_names)}")
         
         logger.info("Category sync completed successfully")
         return True